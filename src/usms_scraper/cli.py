@@ -1,22 +1,21 @@
 """Command-line interface for USMS scraper."""
 
 import argparse
-import csv
 import json
 import logging
-import shutil
+import os
+import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from itertools import chain
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 from .gallery import build_index, create_event_folder, init_from_records
 from .locations import build_index as build_locations_index, create_location_folder
-from .scraper import scrape_team_records, ScraperConfig, USMSScraper
-from .transformer import (
-    transform_multiple_csvs,
-    generate_firebase_import,
-    generate_ndjson,
-)
+from .models import RAW_RECORD_FIELDS, RawRecord
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -29,33 +28,53 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
-def parse_years(years_str: str) -> list[int]:
-    """Parse a year range string like '2015-2025' or '2020,2021,2023' into a list of ints."""
-    if "-" in years_str and "," not in years_str:
-        parts = years_str.split("-")
-        return list(range(int(parts[0]), int(parts[1]) + 1))
-    return [int(y.strip()) for y in years_str.split(",")]
-
+_YEAR_RANGE_RE = re.compile(r"^\s*(\d{4})\s*-\s*(\d{4})\s*$")
 
-def cmd_scrape(args: argparse.Namespace) -> int:
-    """Run the scraper command."""
-    output_dir = Path(args.output)
-    years = parse_years(args.years)
-    courses = [c.strip().upper() for c in args.courses.split(",")]
 
-    logging.info(f"Scraping records for team: {args.team}")
-    logging.info(f"Years: {years[0]}-{years[-1]}, Courses: {courses}, LMSC: {args.lmsc}")
+def parse_years(years_str: str) -> list[int]:
+    """Parse a year range string like '2015-2025' or '2020,2021,2023' into a list of ints."""
+    m = _YEAR_RANGE_RE.match(years_str)
+    if m:
+        return list(range(int(m[1]), int(m[2]) + 1))
+    parts = [y.strip() for y in years_str.split(",")]
+    if not all(y.isdigit() for y in parts):
+        raise ValueError(f"Invalid years: {years_str!r}")
+    return [int(y) for y in parts]
+
+
+def _parse_courses(courses_str: str) -> list[str]:
+    """Parse a comma-separated course list like 'SCY,scm' into upper-case codes."""
+    return [c.strip().upper() for c in courses_str.split(",")]
+
+
+def _do_scrape(
+    team: str,
+    output_dir: Path,
+    years: list[int],
+    courses: list[str],
+    lmsc: str,
+    delay: float,
+    headless: bool,
+    save_debug_html: bool,
+    use_selenium: bool = True,
+) -> int:
+    """Scrape records for a team into per-course/year CSVs. Returns an exit code."""
+    from .scraper import scrape_team_records
+
+    logging.info(f"Scraping records for team: {team}")
+    logging.info(f"Years: {years[0]}-{years[-1]}, Courses: {courses}, LMSC: {lmsc}")
 
     try:
         csv_files = scrape_team_records(
-            team_code=args.team,
+            team_code=team,
             output_dir=output_dir,
-            lmsc_id=args.lmsc,
+            lmsc_id=lmsc,
             years=years,
             courses=courses,
-            delay=args.delay,
-            headless=not args.show_browser,
-            save_debug_html=args.debug_html,
+            delay=delay,
+            headless=headless,
+            save_debug_html=save_debug_html,
+            use_selenium=use_selenium,
         )
 
         logging.info(f"Created {len(csv_files)} CSV files:")
@@ -69,45 +88,52 @@ def cmd_scrape(args: argparse.Namespace) -> int:
         return 1
 
 
-def cmd_transform(args: argparse.Namespace) -> int:
-    """Run the transform command."""
-    input_path = Path(args.input)
-    output_dir = Path(args.output)
+def _find_csv_files(input_path: Path) -> list[Path] | None:
+    """Resolve a CSV file or directory of CSVs. Logs and returns None if there are none."""
+    if input_path.is_file():
+        return [input_path]
+    if input_path.is_dir():
+        csv_files = list(input_path.glob("*.csv"))
+        if not csv_files:
+            logging.error(f"No CSV files found in {input_path}")
+            return None
+        return csv_files
+    logging.error(f"Input path does not exist: {input_path}")
+    return None
+
+
+def _do_transform(
+    csv_files: list[Path],
+    output_dir: Path,
+    team: str,
+    combine: bool,
+    firebase: bool,
+    ndjson: bool,
+    pretty: bool,
+) -> int:
+    """Transform CSVs to JSON (plus optional combined/Firebase/NDJSON). Returns an exit code."""
+    from .transformer import generate_firebase_import, generate_ndjson, transform_multiple_csvs
 
     try:
-        if input_path.is_file():
-            csv_files = [input_path]
-        elif input_path.is_dir():
-            csv_files = list(input_path.glob("*.csv"))
-            if not csv_files:
-                logging.error(f"No CSV files found in {input_path}")
-                return 1
-        else:
-            logging.error(f"Input path does not exist: {input_path}")
-            return 1
-
         logging.info(f"Transforming {len(csv_files)} CSV file(s)...")
 
-        combined_path = output_dir / f"{args.team}_all_records.json" if args.combine else None
+        combined_path = output_dir / f"{team}_all_records.json" if combine else None
 
         all_records = transform_multiple_csvs(
             csv_paths=csv_files,
             output_dir=output_dir,
             combined_output=combined_path,
-            pretty=not args.minify,
+            pretty=pretty,
         )
 
-        combined_records = []
-        for records in all_records.values():
-            combined_records.extend(records)
-
-        if args.firebase:
-            firebase_path = output_dir / f"{args.team}_firebase_import.json"
-            generate_firebase_import(combined_records, firebase_path)
+        # Each output gets its own chain over the per-file lists; nothing is concatenated
+        if firebase:
+            firebase_path = output_dir / f"{team}_firebase_import.json"
+            generate_firebase_import(chain.from_iterable(all_records.values()), firebase_path)
 
-        if args.ndjson:
-            ndjson_path = output_dir / f"{args.team}_records.ndjson"
-            generate_ndjson(combined_records, ndjson_path)
+        if ndjson:
+            ndjson_path = output_dir / f"{team}_records.ndjson"
+            generate_ndjson(chain.from_iterable(all_records.values()), ndjson_path)
 
         logging.info(f"Transformation complete. Output in {output_dir}")
         return 0
@@ -117,50 +143,203 @@ def cmd_transform(args: argparse.Namespace) -> int:
         return 1
 
 
-def _record_key(record: dict) -> tuple:
-    """Key that identifies a unique slot: event + course + gender + age_group + rank."""
-    return (
-        record["event"],
-        record["course"],
-        record["gender"],
-        record["age_group"],
-        record["rank"],
+def cmd_scrape(args: argparse.Namespace) -> int:
+    """Run the scraper command."""
+    return _do_scrape(
+        team=args.team,
+        output_dir=Path(args.output),
+        years=parse_years(args.years),
+        courses=_parse_courses(args.courses),
+        lmsc=args.lmsc,
+        delay=args.delay,
+        headless=not args.show_browser,
+        save_debug_html=args.debug_html,
+        use_selenium=not args.no_browser,
+    )
+
+
+def cmd_transform(args: argparse.Namespace) -> int:
+    """Run the transform command."""
+    csv_files = _find_csv_files(Path(args.input))
+    if csv_files is None:
+        return 1
+    return _do_transform(
+        csv_files,
+        output_dir=Path(args.output),
+        team=args.team,
+        combine=args.combine,
+        firebase=args.firebase,
+        ndjson=args.ndjson,
+        pretty=not args.minify,
     )
 
 
-def _record_content(record: dict) -> tuple:
+# Sentinel for "key not present" in the update diff (record content tuples are never None).
+_MISSING = object()
+
+
+# Buffer size for CSV/JSON file I/O; fewer read()/write() syscalls on large files
+_IO_BUFFER_SIZE = 1 << 20
+
+_KEY_FIELDS = ("event", "course", "gender", "age_group", "rank")
+_CONTENT_FIELDS = ("time", "swimmer", "meet")
+
+
+def _record_key(record: RawRecord) -> tuple:
+    """Key that identifies a unique slot: event + course + gender + age_group + rank."""
+    return (record.event, record.course, record.gender, record.age_group, record.rank)
+
+
+def _record_content(record: RawRecord) -> tuple:
     """Content tuple for change detection."""
-    return (record["time"], record["swimmer"], record["meet"])
+    return (record.time, record.swimmer, record.meet)
 
 
-def _load_existing_csv(path: Path) -> list[dict]:
-    """Load records from an existing CSV file."""
+def _iter_existing_keys(path: Path) -> Iterator[tuple[tuple, tuple]]:
+    """Yield (_record_key, _record_content) pairs for each row of an existing CSV file."""
+    import csv
+
     if not path.exists():
-        return []
-    with open(path, newline="", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
-
-
-def _save_records_csv(records: list[dict], path: Path) -> None:
-    """Write records to a CSV file."""
-    fieldnames = [
-        "team",
-        "event",
-        "course",
-        "gender",
-        "age_group",
-        "time",
-        "swimmer",
-        "date",
-        "meet",
-        "year",
-        "rank",
-    ]
+        return
+    with open(path, newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        # Positional getters in the same field order as _record_key/_record_content
+        get_key = itemgetter(*(header.index(name) for name in _KEY_FIELDS))
+        get_content = itemgetter(*(header.index(name) for name in _CONTENT_FIELDS))
+        width = len(header)
+        for row in reader:
+            if not row:  # blank line
+                continue
+            if len(row) < width:
+                # Short row: missing fields read as None, as csv.DictReader would give
+                row = row + [None] * (width - len(row))
+            yield get_key(row), get_content(row)
+
+
+def _save_records_csv(records: list[RawRecord], path: Path) -> None:
+    """Write records to a CSV file.
+
+    The file is written to a temporary sibling and renamed into place, so an interrupted
+    run never leaves a truncated CSV behind for the next update to diff against.
+    """
+    import csv
+
+    get_row = attrgetter(*RAW_RECORD_FIELDS)
+    rows = [get_row(r) for r in records]
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(records)
+    tmp_path = path.with_suffix(".csv.tmp")
+    with open(tmp_path, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(RAW_RECORD_FIELDS)
+        writer.writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _diff_and_save(csv_path: Path, new_records: list[RawRecord]) -> tuple[list, list, int]:
+    """Diff scraped records against an existing CSV and rewrite it if anything changed.
+
+    A digest of the scraped keys/contents is kept in a ``.csv.sha`` sidecar together with the
+    CSV's mtime and size; when both match the previous run the CSV is left untouched without
+    reading it. Any other rewrite of the CSV (scrape, git pull, hand edit) changes its stat
+    and forces a real diff.
+
+    Returns (added records, (updated record, old content) pairs, removed count).
+    """
+    # Key/content tuples are built once per scraped record and reused below.
+    keyed = [(_record_key(r), _record_content(r), r) for r in new_records]
+
+    digest = _records_digest(keyed)
+    sha_path = csv_path.with_suffix(".csv.sha")
+    try:
+        if sha_path.read_text().strip() == f"{digest} {_csv_stamp(csv_path)}":
+            return [], [], 0
+    except FileNotFoundError:
+        pass
+
+    # Pop each scraped key out of the existing lookup; whatever is left afterwards
+    # has dropped out of the results.
+    existing_by_key = dict(_iter_existing_keys(csv_path))
+
+    added = []
+    updated = []
+    for key, content, r in keyed:
+        old = existing_by_key.pop(key, _MISSING)
+        if old is _MISSING:
+            added.append(r)
+        elif content != old:
+            updated.append((r, old))
+
+    removed_count = len(existing_by_key)
+
+    if added or updated or removed_count:
+        _save_records_csv(new_records, csv_path)
+    if csv_path.exists():
+        sha_path.write_text(f"{digest} {_csv_stamp(csv_path)}\n")
+
+    return added, updated, removed_count
+
+
+def _csv_stamp(csv_path: Path) -> str:
+    """The CSV's mtime_ns and size, recorded next to the digest in its .csv.sha sidecar."""
+    st = csv_path.stat()
+    return f"{st.st_mtime_ns} {st.st_size}"
+
+
+def _records_digest(keyed: list[tuple[tuple, tuple, RawRecord]]) -> str:
+    """Order-independent BLAKE2b digest of the (key, content) tuples that drive the diff."""
+    import hashlib
+
+    lines = sorted("\x1f".join(key + content) for key, content, _ in keyed)
+    return hashlib.blake2b("\n".join(lines).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy src to dst, letting the kernel move the bytes where possible.
+
+    On Linux, copy_file_range() copies in-kernel and becomes a reflink on CoW filesystems
+    (btrfs, XFS). Anywhere else, or if the call fails, fall back to a buffered copy. The
+    bytes go to a temporary sibling that is renamed over dst, so a failed or short copy
+    never leaves a truncated dst behind.
+    """
+    import shutil
+
+    if dst.exists() and src.samefile(dst):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+
+    tmp_path = dst.with_name(dst.name + ".tmp")
+    try:
+        _copy_bytes(src, tmp_path)
+        shutil.copystat(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _copy_bytes(src: Path, dst: Path) -> None:
+    """Write the contents of src to dst via copy_file_range(), or a buffered copy."""
+    import shutil
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        # Some filesystems report "nothing copied" instead of an error
+                        raise OSError("copy_file_range copied 0 bytes before end of file")
+                    remaining -= copied
+            return
+        except OSError:
+            pass
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        shutil.copyfileobj(fsrc, fdst, length=_IO_BUFFER_SIZE)
 
 
 def _update_data_index(web_data_dir: Path, record_count: int) -> None:
@@ -181,13 +360,20 @@ def _update_data_index(web_data_dir: Path, record_count: int) -> None:
 
 def cmd_update(args: argparse.Namespace) -> int:
     """Scrape the current year and only update CSVs when new or changed records are found."""
+    from .scraper import ScraperConfig, USMSScraper
+    from .transformer import generate_firebase_import, transform_multiple_csvs
+
     current_year = date.today().year
     output_dir = Path(args.output)
-    courses = [c.strip().upper() for c in args.courses.split(",")]
+    courses = _parse_courses(args.courses)
 
     logging.info(f"Updating {args.team} records for {current_year} ({', '.join(courses)})")
 
     try:
+        # Scan the CSV directory once; files written below are tracked as we go
+        csv_files = list(output_dir.glob("*.csv"))
+        known_csvs = set(csv_files)
+
         config = ScraperConfig(
             team_code=args.team,
             output_dir=output_dir,
@@ -197,31 +383,28 @@ def cmd_update(args: argparse.Namespace) -> int:
             delay_between_requests=args.delay,
             headless=not args.show_browser,
             save_debug_html=args.debug_html,
+            use_selenium=not args.no_browser,
         )
         scraper = USMSScraper(config)
         scraped = scraper.scrape_all_raw()
 
         any_changes = False
-
-        for (year, course), new_records in scraped.items():
-            csv_path = output_dir / f"{args.team}_{course.lower()}_{year}_records.csv"
-            existing = _load_existing_csv(csv_path)
-
-            # Build lookup of existing records by key
-            existing_by_key = {_record_key(r): _record_content(r) for r in existing}
-            new_by_key = {_record_key(r): _record_content(r) for r in new_records}
-
-            # Detect changes
-            added = []
-            updated = []
-            for r in new_records:
-                key = _record_key(r)
-                if key not in existing_by_key:
-                    added.append(r)
-                elif _record_content(r) != existing_by_key[key]:
-                    updated.append(r)
-
-            if not added and not updated and len(new_records) == len(existing):
+        written_paths: list[Path] = []
+
+        csv_paths = [
+            output_dir / f"{args.team}_{course.lower()}_{year}_records.csv"
+            for year, course in scraped
+        ]
+
+        # Each (year, course) reads and writes its own CSV, so they run side by side;
+        # results are logged afterwards in scrape order.
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(scraped)))) as pool:
+            results = list(pool.map(_diff_and_save, csv_paths, scraped.values()))
+
+        for (year, course), csv_path, new_records, (added, updated, removed_count) in zip(
+            scraped, csv_paths, scraped.values(), results
+        ):
+            if not added and not updated and not removed_count:
                 logging.info(f"  {course} {year}: no changes")
                 continue
 
@@ -231,25 +414,21 @@ def cmd_update(args: argparse.Namespace) -> int:
                 logging.info(f"  {course} {year}: {len(added)} new record(s)")
                 for r in added:
                     logging.info(
-                        f"    + {r['gender']} {r['age_group']} {r['event']}"
-                        f" — {r['time']} ({r['swimmer']})"
+                        f"    + {r.gender} {r.age_group} {r.event} — {r.time} ({r.swimmer})"
                     )
 
             if updated:
                 logging.info(f"  {course} {year}: {len(updated)} updated record(s)")
-                for r in updated:
-                    key = _record_key(r)
-                    old = existing_by_key[key]
+                for r, old in updated:
                     logging.info(
-                        f"    ~ {r['gender']} {r['age_group']} {r['event']}"
-                        f" — {old[0]} -> {r['time']} ({r['swimmer']})"
+                        f"    ~ {r.gender} {r.age_group} {r.event}"
+                        f" — {old[0]} -> {r.time} ({r.swimmer})"
                     )
 
-            removed_count = len(existing_by_key) - len(set(existing_by_key) & set(new_by_key))
             if removed_count:
                 logging.info(f"  {course} {year}: {removed_count} record(s) no longer in results")
 
-            _save_records_csv(new_records, csv_path)
+            written_paths.append(csv_path)
             logging.info(f"  Wrote {len(new_records)} records to {csv_path.name}")
 
         if not any_changes:
@@ -258,7 +437,7 @@ def cmd_update(args: argparse.Namespace) -> int:
 
         # Transform all CSVs to JSON
         logging.info("Running transform...")
-        csv_files = list(output_dir.glob("*.csv"))
+        csv_files.extend(p for p in written_paths if p not in known_csvs)
         json_output = Path(args.json_output)
         json_output.mkdir(parents=True, exist_ok=True)
 
@@ -270,13 +449,11 @@ def cmd_update(args: argparse.Namespace) -> int:
             pretty=True,
         )
 
-        combined_records = []
-        for records in all_records.values():
-            combined_records.extend(records)
+        record_count = sum(map(len, all_records.values()))
 
         if args.firebase:
             firebase_path = json_output / f"{args.team}_firebase_import.json"
-            generate_firebase_import(combined_records, firebase_path)
+            generate_firebase_import(chain.from_iterable(all_records.values()), firebase_path)
             logging.info(f"  Firebase import: {firebase_path}")
 
         logging.info(f"  Transform complete. Output in {json_output}")
@@ -285,10 +462,10 @@ def cmd_update(args: argparse.Namespace) -> int:
         web_data_dir = Path(args.web_data)
         web_data_dir.mkdir(parents=True, exist_ok=True)
         dest = web_data_dir / combined_path.name
-        shutil.copy2(combined_path, dest)
+        _fast_copy(combined_path, dest)
         logging.info(f"  Updated website data: {dest}")
 
-        _update_data_index(web_data_dir, len(combined_records))
+        _update_data_index(web_data_dir, record_count)
 
         return 0
 
@@ -299,6 +476,8 @@ def cmd_update(args: argparse.Namespace) -> int:
 
 def cmd_publish(args: argparse.Namespace) -> int:
     """Transform existing CSVs and copy JSON to the web public data directory."""
+    from .transformer import generate_firebase_import, transform_multiple_csvs
+
     csv_dir = Path(args.csv_input)
     json_output = Path(args.json_output)
     web_data_dir = Path(args.web_data)
@@ -319,24 +498,22 @@ def cmd_publish(args: argparse.Namespace) -> int:
         pretty=True,
     )
 
-    combined_records = []
-    for records in all_records.values():
-        combined_records.extend(records)
+    record_count = sum(map(len, all_records.values()))
 
     if args.firebase:
         firebase_path = json_output / f"{args.team}_firebase_import.json"
-        generate_firebase_import(combined_records, firebase_path)
+        generate_firebase_import(chain.from_iterable(all_records.values()), firebase_path)
         logging.info(f"  Firebase import: {firebase_path}")
 
     logging.info(f"  Transform complete. Output in {json_output}")
 
     web_data_dir.mkdir(parents=True, exist_ok=True)
     dest = web_data_dir / combined_path.name
-    shutil.copy2(combined_path, dest)
+    _fast_copy(combined_path, dest)
     logging.info(f"  Updated website data: {dest}")
-    logging.info(f"  Total records: {len(combined_records)}")
+    logging.info(f"  Total records: {record_count}")
 
-    _update_data_index(web_data_dir, len(combined_records))
+    _update_data_index(web_data_dir, record_count)
 
     return 0
 
@@ -442,288 +619,317 @@ def _write_locations_index(locations_dir: Path) -> None:
 
 def cmd_all(args: argparse.Namespace) -> int:
     """Run scrape + transform."""
-    args.output = args.csv_output
-    result = cmd_scrape(args)
+    csv_dir = Path(args.csv_output)
+    result = _do_scrape(
+        team=args.team,
+        output_dir=csv_dir,
+        years=parse_years(args.years),
+        courses=_parse_courses(args.courses),
+        lmsc=args.lmsc,
+        delay=args.delay,
+        headless=not args.show_browser,
+        save_debug_html=args.debug_html,
+        use_selenium=not args.no_browser,
+    )
     if result != 0:
         return result
 
-    args.input = args.csv_output
-    args.output = args.json_output
-    args.combine = True
-    return cmd_transform(args)
-
-
-def main() -> int:
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        description="Scrape USMS team records and transform to JSON for Firebase",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Scrape COLM records
-  usms-scraper scrape --team COLM --output ./data/csv
-
-  # Scrape specific years
-  usms-scraper scrape --team COLM --years 2020-2024
-
-  # Scrape only SCY
-  usms-scraper scrape --team COLM --courses SCY
-
-  # Transform CSVs to JSON
-  usms-scraper transform --input ./data/csv --output ./data/json --team COLM --firebase
-
-  # Do both in one command
-  usms-scraper all --team COLM --csv-output ./data/csv --json-output ./data/json
-        """,
-    )
-
-    parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
-
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    # Scrape command
-    scrape_parser = subparsers.add_parser("scrape", help="Scrape records from USMS")
-    scrape_parser.add_argument("--team", "-t", required=True, help="Team code (e.g., COLM)")
-    scrape_parser.add_argument(
-        "--output", "-o", default="./output/csv", help="Output directory for CSVs"
-    )
-    scrape_parser.add_argument(
+    csv_files = _find_csv_files(csv_dir)
+    if csv_files is None:
+        return 1
+    return _do_transform(
+        csv_files,
+        output_dir=Path(args.json_output),
+        team=args.team,
+        combine=True,
+        firebase=args.firebase,
+        ndjson=args.ndjson,
+        pretty=not args.minify,
+    )
+
+
+def _add_scrape_args(p: argparse.ArgumentParser) -> None:
+    """Add arguments for the scrape command."""
+    p.add_argument("--team", "-t", required=True, help="Team code (e.g., COLM)")
+    p.add_argument("--output", "-o", default="./output/csv", help="Output directory for CSVs")
+    p.add_argument(
         "--years",
         "-y",
         default=f"2015-{date.today().year}",
         help="Year range (e.g., 2015-2025) or comma-separated (e.g., 2020,2022,2024)",
     )
-    scrape_parser.add_argument(
+    p.add_argument(
         "--courses",
         default="SCY,SCM,LCM",
         help="Comma-separated courses (default: SCY,SCM,LCM)",
     )
-    scrape_parser.add_argument(
+    p.add_argument(
         "--lmsc",
         default="55",
         help="LMSC ID (default: 55 for South Carolina)",
     )
-    scrape_parser.add_argument(
+    p.add_argument(
         "--delay",
         "-d",
         type=float,
         default=2.0,
         help="Delay between requests in seconds (default: 2.0)",
     )
-    scrape_parser.add_argument(
+    p.add_argument(
         "--show-browser",
         action="store_true",
         help="Show browser window (default: headless)",
     )
-    scrape_parser.add_argument(
+    p.add_argument(
         "--debug-html",
         action="store_true",
         help="Save raw HTML pages for debugging",
     )
-    scrape_parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
-    scrape_parser.set_defaults(func=cmd_scrape)
-
-    # Transform command
-    transform_parser = subparsers.add_parser("transform", help="Transform CSV to JSON")
-    transform_parser.add_argument("--input", "-i", required=True, help="Input CSV file or dir")
-    transform_parser.add_argument(
-        "--output", "-o", default="./output/json", help="Output directory for JSON"
-    )
-    transform_parser.add_argument(
-        "--team", "-t", default="team", help="Team code for output filenames"
-    )
-    transform_parser.add_argument(
-        "--combine", "-c", action="store_true", help="Create combined JSON file"
-    )
-    transform_parser.add_argument(
-        "--firebase", "-f", action="store_true", help="Generate Firebase import format"
-    )
-    transform_parser.add_argument(
-        "--ndjson", "-n", action="store_true", help="Generate NDJSON format"
-    )
-    transform_parser.add_argument("--minify", "-m", action="store_true", help="Minify JSON output")
-    transform_parser.add_argument(
-        "-v", "--verbose", action="store_true", help="Enable debug logging"
+    p.add_argument(
+        "--no-browser",
+        action="store_true",
+        help="Post the search form directly over HTTP instead of driving Chrome",
     )
-    transform_parser.set_defaults(func=cmd_transform)
 
-    # Update command (current year only, idempotent)
-    update_parser = subparsers.add_parser(
-        "update", help="Scrape current year and update only if new/changed records found"
-    )
-    update_parser.add_argument("--team", "-t", required=True, help="Team code (e.g., COLM)")
-    update_parser.add_argument(
-        "--output", "-o", default="./data/csv", help="Output directory for CSVs"
-    )
-    update_parser.add_argument(
+
+def _add_transform_args(p: argparse.ArgumentParser) -> None:
+    """Add arguments for the transform command."""
+    p.add_argument("--input", "-i", required=True, help="Input CSV file or dir")
+    p.add_argument("--output", "-o", default="./output/json", help="Output directory for JSON")
+    p.add_argument("--team", "-t", default="team", help="Team code for output filenames")
+    p.add_argument("--combine", "-c", action="store_true", help="Create combined JSON file")
+    p.add_argument("--firebase", "-f", action="store_true", help="Generate Firebase import format")
+    p.add_argument("--ndjson", "-n", action="store_true", help="Generate NDJSON format")
+    p.add_argument("--minify", "-m", action="store_true", help="Minify JSON output")
+
+
+def _add_update_args(p: argparse.ArgumentParser) -> None:
+    """Add arguments for the update command."""
+    p.add_argument("--team", "-t", required=True, help="Team code (e.g., COLM)")
+    p.add_argument("--output", "-o", default="./data/csv", help="Output directory for CSVs")
+    p.add_argument(
         "--courses",
         default="SCY,SCM,LCM",
         help="Comma-separated courses (default: SCY,SCM,LCM)",
     )
-    update_parser.add_argument(
+    p.add_argument(
         "--lmsc",
         default="55",
         help="LMSC ID (default: 55 for South Carolina)",
     )
-    update_parser.add_argument(
+    p.add_argument(
         "--delay", "-d", type=float, default=2.0, help="Delay between requests (seconds)"
     )
-    update_parser.add_argument("--show-browser", action="store_true", help="Show browser window")
-    update_parser.add_argument(
-        "--debug-html", action="store_true", help="Save raw HTML for debugging"
+    p.add_argument("--show-browser", action="store_true", help="Show browser window")
+    p.add_argument("--debug-html", action="store_true", help="Save raw HTML for debugging")
+    p.add_argument(
+        "--no-browser", action="store_true", help="Post the form over HTTP instead of Chrome"
     )
-    update_parser.add_argument(
-        "--json-output", default="./data/json", help="Output directory for JSON"
-    )
-    update_parser.add_argument(
+    p.add_argument("--json-output", default="./data/json", help="Output directory for JSON")
+    p.add_argument(
         "--web-data",
         default="./web/public/data",
         help="Web public data directory for website JSON (default: ./web/public/data)",
     )
-    update_parser.add_argument(
+    p.add_argument(
         "--firebase",
         "-f",
         action="store_true",
         help="Generate Firebase import format (with --transform)",
     )
-    update_parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
-    update_parser.set_defaults(func=cmd_update)
 
-    # Publish command (transform + copy to web)
-    publish_parser = subparsers.add_parser(
-        "publish", help="Transform existing CSVs and copy JSON to the website"
-    )
-    publish_parser.add_argument("--team", "-t", required=True, help="Team code (e.g., COLM)")
-    publish_parser.add_argument(
-        "--csv-input", default="./data/csv", help="Directory containing CSV files"
-    )
-    publish_parser.add_argument(
-        "--json-output", default="./data/json", help="Output directory for JSON"
-    )
-    publish_parser.add_argument(
+
+def _add_publish_args(p: argparse.ArgumentParser) -> None:
+    """Add arguments for the publish command."""
+    p.add_argument("--team", "-t", required=True, help="Team code (e.g., COLM)")
+    p.add_argument("--csv-input", default="./data/csv", help="Directory containing CSV files")
+    p.add_argument("--json-output", default="./data/json", help="Output directory for JSON")
+    p.add_argument(
         "--web-data",
         default="./web/public/data",
         help="Web public data directory (default: ./web/public/data)",
     )
-    publish_parser.add_argument(
-        "--firebase", "-f", action="store_true", help="Generate Firebase import format"
-    )
-    publish_parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
-    publish_parser.set_defaults(func=cmd_publish)
+    p.add_argument("--firebase", "-f", action="store_true", help="Generate Firebase import format")
 
-    # Gallery init command
-    gi_parser = subparsers.add_parser(
-        "gallery-init", help="Create gallery folders from existing meet records"
-    )
-    gi_parser.add_argument(
-        "--csv-input", default="./data/csv", help="Directory containing record CSVs"
-    )
-    gi_parser.add_argument(
+
+def _add_gallery_init_args(p: argparse.ArgumentParser) -> None:
+    """Add arguments for the gallery-init command."""
+    p.add_argument("--csv-input", default="./data/csv", help="Directory containing record CSVs")
+    p.add_argument(
         "--gallery-dir",
         default="./web/public/gallery",
         help="Gallery directory (default: ./web/public/gallery)",
     )
-    gi_parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
-    gi_parser.set_defaults(func=cmd_gallery_init)
 
-    # Gallery add command
-    ga_parser = subparsers.add_parser(
-        "gallery-add", help="Add a gallery event folder (meets or social events)"
-    )
-    ga_parser.add_argument("--name", "-n", required=True, help="Event name")
-    ga_parser.add_argument("--date", "-d", default="", help="Event date (YYYY-MM-DD)")
-    ga_parser.add_argument("--description", default="", help="Event description")
-    ga_parser.add_argument(
+
+def _add_gallery_add_args(p: argparse.ArgumentParser) -> None:
+    """Add arguments for the gallery-add command."""
+    p.add_argument("--name", "-n", required=True, help="Event name")
+    p.add_argument("--date", "-d", default="", help="Event date (YYYY-MM-DD)")
+    p.add_argument("--description", default="", help="Event description")
+    p.add_argument(
         "--type",
         default="social",
         choices=["meet", "social"],
         help="Event type (default: social)",
     )
-    ga_parser.add_argument("--course", default="", help="Course code (scy/scm/lcm) for meets")
-    ga_parser.add_argument(
+    p.add_argument("--course", default="", help="Course code (scy/scm/lcm) for meets")
+    p.add_argument(
         "--gallery-dir",
         default="./web/public/gallery",
         help="Gallery directory (default: ./web/public/gallery)",
     )
-    ga_parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
-    ga_parser.set_defaults(func=cmd_gallery_add)
 
-    # Gallery index command
-    gx_parser = subparsers.add_parser(
-        "gallery-index", help="Regenerate gallery index.json from event folders"
-    )
-    gx_parser.add_argument(
+
+def _add_gallery_index_args(p: argparse.ArgumentParser) -> None:
+    """Add arguments for the gallery-index command."""
+    p.add_argument(
         "--gallery-dir",
         default="./web/public/gallery",
         help="Gallery directory (default: ./web/public/gallery)",
     )
-    gx_parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
-    gx_parser.set_defaults(func=cmd_gallery_index)
 
-    # Locations add command
-    la_parser = subparsers.add_parser(
-        "locations-add", help="Create a practice location folder for images"
-    )
-    la_parser.add_argument("--name", "-n", required=True, help="Location name")
-    la_parser.add_argument(
+
+def _add_locations_add_args(p: argparse.ArgumentParser) -> None:
+    """Add arguments for the locations-add command."""
+    p.add_argument("--name", "-n", required=True, help="Location name")
+    p.add_argument(
         "--locations-dir",
         default="./web/public/locations",
         help="Locations directory (default: ./web/public/locations)",
     )
-    la_parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
-    la_parser.set_defaults(func=cmd_locations_add)
 
-    # Locations index command
-    lx_parser = subparsers.add_parser(
-        "locations-index", help="Regenerate locations/index.json from location folders"
-    )
-    lx_parser.add_argument(
+
+def _add_locations_index_args(p: argparse.ArgumentParser) -> None:
+    """Add arguments for the locations-index command."""
+    p.add_argument(
         "--locations-dir",
         default="./web/public/locations",
         help="Locations directory (default: ./web/public/locations)",
     )
-    lx_parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
-    lx_parser.set_defaults(func=cmd_locations_index)
 
-    # All command (scrape + transform)
-    all_parser = subparsers.add_parser("all", help="Scrape and transform in one step")
-    all_parser.add_argument("--team", "-t", required=True, help="Team code (e.g., COLM)")
-    all_parser.add_argument(
-        "--csv-output", default="./output/csv", help="Output directory for CSVs"
-    )
-    all_parser.add_argument(
-        "--json-output", default="./output/json", help="Output directory for JSON"
-    )
-    all_parser.add_argument(
+
+def _add_all_args(p: argparse.ArgumentParser) -> None:
+    """Add arguments for the all command."""
+    p.add_argument("--team", "-t", required=True, help="Team code (e.g., COLM)")
+    p.add_argument("--csv-output", default="./output/csv", help="Output directory for CSVs")
+    p.add_argument("--json-output", default="./output/json", help="Output directory for JSON")
+    p.add_argument(
         "--years",
         "-y",
         default=f"2015-{date.today().year}",
         help="Year range (e.g., 2015-2025) or comma-separated",
     )
-    all_parser.add_argument(
+    p.add_argument(
         "--courses",
         default="SCY,SCM,LCM",
         help="Comma-separated courses (default: SCY,SCM,LCM)",
     )
-    all_parser.add_argument(
+    p.add_argument(
         "--lmsc",
         default="55",
         help="LMSC ID (default: 55 for South Carolina)",
     )
-    all_parser.add_argument(
+    p.add_argument(
         "--delay", "-d", type=float, default=2.0, help="Delay between requests (seconds)"
     )
-    all_parser.add_argument("--show-browser", action="store_true", help="Show browser window")
-    all_parser.add_argument("--debug-html", action="store_true", help="Save raw HTML for debugging")
-    all_parser.add_argument(
-        "--firebase", "-f", action="store_true", help="Generate Firebase import format"
+    p.add_argument("--show-browser", action="store_true", help="Show browser window")
+    p.add_argument("--debug-html", action="store_true", help="Save raw HTML for debugging")
+    p.add_argument(
+        "--no-browser", action="store_true", help="Post the form over HTTP instead of Chrome"
+    )
+    p.add_argument("--firebase", "-f", action="store_true", help="Generate Firebase import format")
+    p.add_argument("--ndjson", "-n", action="store_true", help="Generate NDJSON format")
+    p.add_argument("--minify", "-m", action="store_true", help="Minify JSON output")
+
+
+# Subcommand name -> (help text, argument builder, handler). Only the builder for the
+# subcommand actually being run is called, so unused commands cost a bare add_parser().
+COMMANDS = {
+    "scrape": ("Scrape records from USMS", _add_scrape_args, cmd_scrape),
+    "transform": ("Transform CSV to JSON", _add_transform_args, cmd_transform),
+    "update": (
+        "Scrape current year and update only if new/changed records found",
+        _add_update_args,
+        cmd_update,
+    ),
+    "publish": (
+        "Transform existing CSVs and copy JSON to the website",
+        _add_publish_args,
+        cmd_publish,
+    ),
+    "gallery-init": (
+        "Create gallery folders from existing meet records",
+        _add_gallery_init_args,
+        cmd_gallery_init,
+    ),
+    "gallery-add": (
+        "Add a gallery event folder (meets or social events)",
+        _add_gallery_add_args,
+        cmd_gallery_add,
+    ),
+    "gallery-index": (
+        "Regenerate gallery index.json from event folders",
+        _add_gallery_index_args,
+        cmd_gallery_index,
+    ),
+    "locations-add": (
+        "Create a practice location folder for images",
+        _add_locations_add_args,
+        cmd_locations_add,
+    ),
+    "locations-index": (
+        "Regenerate locations/index.json from location folders",
+        _add_locations_index_args,
+        cmd_locations_index,
+    ),
+    "all": ("Scrape and transform in one step", _add_all_args, cmd_all),
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        description="Scrape USMS team records and transform to JSON for Firebase",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Scrape COLM records
+  usms-scraper scrape --team COLM --output ./data/csv
+
+  # Scrape specific years
+  usms-scraper scrape --team COLM --years 2020-2024
+
+  # Scrape only SCY
+  usms-scraper scrape --team COLM --courses SCY
+
+  # Transform CSVs to JSON
+  usms-scraper transform --input ./data/csv --output ./data/json --team COLM --firebase
+
+  # Do both in one command
+  usms-scraper all --team COLM --csv-output ./data/csv --json-output ./data/json
+        """,
     )
-    all_parser.add_argument("--ndjson", "-n", action="store_true", help="Generate NDJSON format")
-    all_parser.add_argument("--minify", "-m", action="store_true", help="Minify JSON output")
-    all_parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
-    all_parser.set_defaults(func=cmd_all)
 
-    args = parser.parse_args()
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # The top-level parser only takes flags, so the first positional is the subcommand.
+    # Top-level --help (or no subcommand) only needs the name/help shells.
+    selected = next((a for a in argv if not a.startswith("-")), None)
+
+    for name, (help_text, add_args, func) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if name == selected:
+            add_args(sub)
+            sub.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
+        sub.set_defaults(func=func)
+
+    args = parser.parse_args(argv)
     setup_logging(args.verbose)
 
     return args.func(args)
@@ -1,11 +1,36 @@
 """Data models for USMS records."""
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import Optional
-import re
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class RawRecord:
+    """A record row as scraped from USMS, before normalization (one CSV row)."""
+
+    team: str
+    event: str
+    course: str
+    gender: str
+    age_group: str
+    time: str
+    swimmer: str
+    date: str
+    meet: str
+    year: str
+    rank: str
+
+
+# CSV column order for raw records
+RAW_RECORD_FIELDS = tuple(f.name for f in fields(RawRecord))
+
+# Single-pass character maps for the slugs in TeamRecord.id
+_EVENT_TRANS = str.maketrans({" ": "_", "-": "_"})
+_AGE_TRANS = str.maketrans({"-": "_", "+": "plus"})
+
+
+@dataclass(slots=True)
 class TeamRecord:
     """A single team record entry."""
 
@@ -24,14 +49,12 @@ class TeamRecord:
     @property
     def id(self) -> str:
         """Generate document ID for Firebase."""
-        event_slug = self.event.lower().replace(" ", "_").replace("-", "_")
-        age_slug = self.age_group.replace("-", "_").replace("+", "plus")
+        event_slug = self.event.lower().translate(_EVENT_TRANS)
+        age_slug = self.age_group.translate(_AGE_TRANS)
         return f"{self.team}_{event_slug}_{self.course}_{self.gender}_{age_slug}"
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        d = asdict(self)
-        d["id"] = self.id
         # Convert snake_case to camelCase for Firebase
         return {
             "id": self.id,
@@ -49,6 +72,18 @@ class TeamRecord:
         }
 
 
+# Stroke words in event names mapped to their short form (per whitespace token)
+_EVENT_TOKENS = {
+    "freestyle": "free",
+    "backstroke": "back",
+    "breaststroke": "breast",
+    "butterfly": "fly",
+}
+
+
+# Per-row normalizers below are cached: their inputs (course codes, genders, event names,
+# times) repeat heavily across a batch of records.
+@lru_cache(maxsize=4096)
 def parse_time_to_seconds(time_str: str) -> float:
     """
     Convert swim time string to seconds.
@@ -59,57 +94,42 @@ def parse_time_to_seconds(time_str: str) -> float:
     - "10:02.45" (minutes:seconds.hundredths)
     - "1:02:45.67" (hours:minutes:seconds.hundredths) - for distance events
     """
-    time_str = time_str.strip()
-
-    # Handle hour:min:sec.hundredths (rare, for very long events)
-    if time_str.count(":") == 2:
-        match = re.match(r"(\d+):(\d+):(\d+\.?\d*)", time_str)
-        if match:
-            hours, minutes, seconds = match.groups()
-            return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-
-    # Handle min:sec.hundredths
-    if ":" in time_str:
-        match = re.match(r"(\d+):(\d+\.?\d*)", time_str)
-        if match:
-            minutes, seconds = match.groups()
-            return int(minutes) * 60 + float(seconds)
-
-    # Just seconds
+    parts = time_str.strip().split(":")
+
     try:
-        return float(time_str)
+        if len(parts) == 1:
+            return float(parts[0])
+        if len(parts) > 3:
+            return 0.0
+
+        # int()/float() alone would also accept signs, inner spaces and "_" separators
+        *whole, seconds = parts
+        if not all(p.isdigit() for p in whole) or not seconds[:1].isdigit():
+            return 0.0
+        if len(whole) == 2:
+            return int(whole[0]) * 3600 + int(whole[1]) * 60 + float(seconds)
+        return int(whole[0]) * 60 + float(seconds)
     except ValueError:
         return 0.0
 
 
+@lru_cache(maxsize=4096)
 def normalize_event_name(event: str) -> str:
     """Normalize event names to consistent format."""
-    event = event.strip().lower()
-
-    # Common replacements
-    replacements = {
-        "free": "free",
-        "freestyle": "free",
-        "back": "back",
-        "backstroke": "back",
-        "breast": "breast",
-        "breaststroke": "breast",
-        "fly": "fly",
-        "butterfly": "fly",
-        "im": "im",
-        "individual medley": "im",
-        "medley": "medley",
-    }
-
-    for old, new in replacements.items():
-        event = event.replace(old, new)
+    tokens = [_EVENT_TOKENS.get(t, t) for t in event.lower().split()]
 
-    # Remove extra spaces
-    event = "_".join(event.split())
+    # "individual medley" -> "im"
+    out: list[str] = []
+    for token in tokens:
+        if token == "medley" and out and out[-1] == "individual":
+            out[-1] = "im"
+        else:
+            out.append(token)
 
-    return event
+    return "_".join(out)
 
 
+@lru_cache(maxsize=4096)
 def normalize_course(course: str) -> str:
     """Normalize course codes."""
     course = course.strip().upper()
@@ -130,6 +150,7 @@ def normalize_course(course: str) -> str:
     return mappings.get(course, course.lower())
 
 
+@lru_cache(maxsize=4096)
 def normalize_gender(gender: str) -> str:
     """Normalize gender to 'men' or 'women'."""
     gender = gender.strip().lower()
@@ -4,21 +4,41 @@ import csv
 import re
 import time
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from html import escape, unescape
+from operator import attrgetter
 from pathlib import Path
 from dataclasses import dataclass, field
 
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+
+from .models import RAW_RECORD_FIELDS, RawRecord
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for CSV output; one large buffer instead of many 8 KiB flushes
+_IO_BUFFER_SIZE = 1 << 20
+
+# Concurrent form POSTs in HTTP mode, each worker pausing delay_between_requests between its
+# own requests. The session's connection pool is sized to cover them all.
+_HTTP_WORKERS = 4
+_HTTP_POOL_SIZE = 8
+
 TOP_TEN_LOCAL_URL = "https://www.usms.org/comp/meets/toptenlocal.php"
 
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
 # Course display text as it appears in the USMS form
 COURSE_LABELS = {
     "SCY": "Short Course Yards",
@@ -26,6 +46,109 @@ COURSE_LABELS = {
     "LCM": "Long Course Meters",
 }
 
+# Course <select> option values in the USMS form (CourseID). Used for direct form POSTs and
+# to select the course by value; the option-text scan is only a fallback.
+COURSE_ID_VALUES = {
+    "SCY": "1",
+    "SCM": "2",
+    "LCM": "3",
+}
+
+# Fills and submits the form in a single browser roundtrip. Covers only the direct path:
+# year and course by name (year falls back to the first text input), the LMSC <select> by
+# name with the LMSC id or South Carolina option, and the club input by name, then submits
+# within the year field's form. Any other layout returns an error string before a field
+# is touched, so the caller falls back to USMSScraper._fill_form/_submit_form and their
+# wider locator ladders and warnings. Arguments: year, course code, course option value,
+# course label, LMSC id, club code.
+_FILL_AND_SUBMIT_JS = """
+const [year, course, courseId, courseLabel, lmscId, club] = arguments;
+const byName = (names) => {
+    for (const n of names) {
+        const el = document.getElementsByName(n)[0];
+        if (el) return el;
+    }
+    return null;
+};
+const fire = (el, type) => el.dispatchEvent(new Event(type, {bubbles: true}));
+const find = (select, ...tests) => {
+    for (const test of tests) {
+        const opt = Array.from(select.options).find(test);
+        if (opt) return opt;
+    }
+    return null;
+};
+const choose = (select, opt) => {
+    select.value = opt.value;
+    fire(select, "change");
+};
+
+// Resolve every field before changing any, so a fallback starts from an untouched form
+const yearEl = byName(["Year", "year", "YearID", "yearID"])
+    || document.querySelector("input[type='text']");
+if (!yearEl) return "year field not found";
+const form = yearEl.form;
+if (!form) return "year field is not inside a form";
+let yearOpt = null;
+if (yearEl.tagName === "SELECT") {
+    yearOpt = find(yearEl, (o) => o.text.trim() === String(year));
+    if (!yearOpt) return "year not in dropdown";
+}
+
+const courseEl = byName(["CourseID", "Course", "course", "courseID"]);
+if (!courseEl || courseEl.tagName !== "SELECT") return "course select not found";
+const label = courseLabel.toLowerCase();
+const courseOpt = find(
+    courseEl,
+    (o) => o.value === courseId,
+    (o) => o.text.toLowerCase().includes(label) || o.text.includes(course),
+);
+if (!courseOpt) return "course option not found";
+
+const lmscEl = byName(["LMSCID", "lmscID", "LMSC", "lmsc"]);
+if (!lmscEl || lmscEl.tagName !== "SELECT") return "LMSC select not found";
+const lmscOpt = find(
+    lmscEl,
+    (o) => o.value === lmscId,
+    (o) => o.text.toLowerCase().includes("south carolina"),
+);
+if (!lmscOpt) return "LMSC option not found";
+
+const clubEl = byName(["Club", "club", "ClubAbbr", "clubabbr"]);
+if (!clubEl) return "club field not found by name";
+
+if (yearOpt) {
+    choose(yearEl, yearOpt);
+} else {
+    yearEl.value = String(year);
+    fire(yearEl, "input");
+}
+choose(courseEl, courseOpt);
+choose(lmscEl, lmscOpt);
+clubEl.value = club;
+fire(clubEl, "input");
+
+// Selectors in priority order (a combined selector would match in document order), and
+// only within the search form so an unrelated button elsewhere on the page is never hit
+const submitSelectors = [
+    "input[type='submit']",
+    "button[type='submit']",
+    "input[value='Submit']",
+    "input[value='Go']",
+    "input[value='Search']",
+    "button",
+];
+for (const selector of submitSelectors) {
+    const btn = form.querySelector(selector);
+    if (btn) {
+        btn.click();
+        return "";
+    }
+}
+form.submit();
+return "";
+"""
+
 
 @dataclass
 class ScraperConfig:
@@ -40,14 +163,45 @@ class ScraperConfig:
     timeout: int = 30
     headless: bool = True
     save_debug_html: bool = False
+    use_selenium: bool = True  # False: POST the form with requests instead of driving Chrome
 
 
 class USMSScraper:
     """Scraper for USMS team records using Selenium."""
 
+    # Locator candidates per form field, tried in order. The page layout is the same on
+    # every request, so whichever one works is cached and tried first next time.
+    _YEAR_LOCATORS = (
+        # <select> dropdown (preferred), then text input
+        (By.NAME, "Year"),
+        (By.NAME, "year"),
+        (By.NAME, "YearID"),
+        (By.NAME, "yearID"),
+        (By.CSS_SELECTOR, "input[name='Year']"),
+        (By.CSS_SELECTOR, "input[name='year']"),
+        (By.CSS_SELECTOR, "input[type='text']"),
+    )
+    _COURSE_LOCATORS = tuple((By.NAME, n) for n in ("CourseID", "Course", "course", "courseID"))
+    _LMSC_LOCATORS = tuple((By.NAME, n) for n in ("LMSCID", "lmscID", "LMSC", "lmsc"))
+    _CLUB_LOCATORS = tuple((By.NAME, n) for n in ("Club", "club", "ClubAbbr", "clubabbr"))
+    _SUBMIT_LOCATORS = tuple(
+        (By.CSS_SELECTOR, selector)
+        for selector in (
+            "input[type='submit']",
+            "button[type='submit']",
+            "input[value='Submit']",
+            "input[value='Go']",
+            "input[value='Search']",
+            "button",
+        )
+    )
+
     def __init__(self, config: ScraperConfig):
         self.config = config
         self.driver = None
+        self.session = None
+        # Form field -> (By, selector) that last located it
+        self._selector_cache: dict[str, tuple[str, str]] = {}
 
     def _create_driver(self) -> webdriver.Chrome:
         """Create a headless Chrome browser instance."""
@@ -57,81 +211,132 @@ class USMSScraper:
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        options.add_argument(f"user-agent={USER_AGENT}")
         return webdriver.Chrome(options=options)
 
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session for posting the form directly."""
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+        session.mount("https://", adapter)
+        return session
+
     def scrape_all(self) -> list[Path]:
         """Scrape all records for the configured team across years and courses."""
         output_files = []
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
-        try:
-            self.driver = self._create_driver()
-            logger.info(f"Browser started. Scraping {self.config.team_code} records...")
+        for year, course, records in self._scrape_each():
+            if records:
+                output_file = self._save_to_csv(records, course, year)
+                output_files.append(output_file)
+                logger.info(f"  Saved {len(records)} records to {output_file.name}")
+            else:
+                logger.info(f"  No records found for {course} {year}")
 
-            for year in self.config.years:
-                for course in self.config.courses:
-                    logger.info(f"Fetching {course} {year} for {self.config.team_code}...")
+        return output_files
 
-                    try:
-                        records = self._scrape_year_course(year, course)
-                    except Exception as e:
-                        logger.error(f"Failed {course} {year}: {e}")
-                        continue
+    def scrape_all_raw(self) -> dict[tuple[int, str], list[RawRecord]]:
+        """Scrape all records and return them grouped by (year, course) without writing files."""
+        results: dict[tuple[int, str], list[RawRecord]] = {}
 
-                    if records:
-                        output_file = self._save_to_csv(records, course, year)
-                        output_files.append(output_file)
-                        logger.info(f"  Saved {len(records)} records to {output_file.name}")
-                    else:
-                        logger.info(f"  No records found for {course} {year}")
+        for year, course, records in self._scrape_each():
+            results[(year, course)] = records
+            if records:
+                logger.info(f"  Found {len(records)} records")
+            else:
+                logger.info(f"  No records found for {course} {year}")
 
-                    time.sleep(self.config.delay_between_requests)
+        return results
+
+    def _scrape_each(self) -> Iterator[tuple[int, str, list[RawRecord]]]:
+        """Scrape every configured year and course, yielding (year, course, records).
+
+        Uses the browser (one page at a time) or a shared HTTP session (several pages
+        concurrently) depending on config.use_selenium. Results are yielded in year/course
+        order either way; failed pages are logged and skipped.
+        """
+        try:
+            if self.config.use_selenium:
+                self.driver = self._create_driver()
+                logger.info(f"Browser started. Scraping {self.config.team_code} records...")
+                yield from self._scrape_each_browser()
+            else:
+                self.session = self._create_session()
+                logger.info(f"Scraping {self.config.team_code} records over HTTP...")
+                yield from self._scrape_each_http()
 
         finally:
             if self.driver:
                 self.driver.quit()
+                self.driver = None
                 logger.info("Browser closed.")
+            if self.session:
+                self.session.close()
+                self.session = None
 
-        return output_files
+    def _scrape_each_browser(self) -> Iterator[tuple[int, str, list[RawRecord]]]:
+        """Scrape each year and course in turn with the browser."""
+        for year in self.config.years:
+            for course in self.config.courses:
+                logger.info(f"Fetching {course} {year} for {self.config.team_code}...")
 
-    def scrape_all_raw(self) -> dict[tuple[int, str], list[dict]]:
-        """Scrape all records and return them grouped by (year, course) without writing files."""
-        results: dict[tuple[int, str], list[dict]] = {}
+                try:
+                    records = self._scrape_year_course(year, course)
+                except Exception as e:
+                    logger.error(f"Failed {course} {year}: {e}")
+                    continue
 
-        try:
-            self.driver = self._create_driver()
-            logger.info(f"Browser started. Scraping {self.config.team_code} records...")
+                yield year, course, records
 
-            for year in self.config.years:
-                for course in self.config.courses:
-                    logger.info(f"Fetching {course} {year} for {self.config.team_code}...")
+                time.sleep(self.config.delay_between_requests)
 
-                    try:
-                        records = self._scrape_year_course(year, course)
-                    except Exception as e:
-                        logger.error(f"Failed {course} {year}: {e}")
-                        continue
+    def _scrape_each_http(self) -> Iterator[tuple[int, str, list[RawRecord]]]:
+        """Fetch all years and courses concurrently over the shared HTTP session."""
+        combos = [(year, course) for year in self.config.years for course in self.config.courses]
+        logger.info(f"Fetching {len(combos)} pages with {_HTTP_WORKERS} workers...")
 
-                    results[(year, course)] = records
-                    if records:
-                        logger.info(f"  Found {len(records)} records")
-                    else:
-                        logger.info(f"  No records found for {course} {year}")
+        with ThreadPoolExecutor(max_workers=_HTTP_WORKERS) as pool:
+            futures = [pool.submit(self._fetch_paced, year, course) for year, course in combos]
+            for (year, course), future in zip(combos, futures):
+                try:
+                    records = future.result()
+                except Exception as e:
+                    logger.error(f"Failed {course} {year}: {e}")
+                    continue
 
-                    time.sleep(self.config.delay_between_requests)
+                logger.info(f"Fetched {course} {year} for {self.config.team_code}")
+                yield year, course, records
 
+    def _fetch_paced(self, year: int, course: str) -> list[RawRecord]:
+        """Fetch one year and course, then hold this worker for the request delay."""
+        try:
+            return self._fetch_year_course(year, course)
         finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("Browser closed.")
+            time.sleep(self.config.delay_between_requests)
+
+    def _fetch_year_course(self, year: int, course: str) -> list[RawRecord]:
+        """Fetch all records for a given year and course by posting the form directly."""
+        response = self.session.post(
+            TOP_TEN_LOCAL_URL,
+            data={
+                "Year": str(year),
+                "CourseID": COURSE_ID_VALUES[course],
+                "LMSCID": self.config.lmsc_id,
+                "ClubAbbr": self.config.team_code,
+            },
+            timeout=self.config.timeout,
+        )
+        response.raise_for_status()
 
-        return results
+        html = response.text
+        if self.config.save_debug_html:
+            self._dump_page_source(f"results_{course}_{year}", html)
 
-    def _scrape_year_course(self, year: int, course: str) -> list[dict]:
+        return self._parse_html(html, course, year)
+
+    def _scrape_year_course(self, year: int, course: str) -> list[RawRecord]:
         """Scrape all records for a given year and course."""
         self.driver.get(TOP_TEN_LOCAL_URL)
 
@@ -163,6 +368,25 @@ class USMSScraper:
             logger.info(f"  Year {year} not available in form (max: {max(available_years)})")
             return []
 
+        # Fill in and submit the form in one roundtrip when the page layout allows it
+        try:
+            error = self.driver.execute_script(
+                _FILL_AND_SUBMIT_JS,
+                year,
+                course,
+                COURSE_ID_VALUES[course],
+                COURSE_LABELS[course],
+                self.config.lmsc_id,
+                self.config.team_code,
+            )
+        except Exception as e:
+            error = str(e)
+        if not error:
+            # Wait for page to change or results to appear
+            time.sleep(3)
+            return self._parse_results(course, year)
+        logger.debug(f"Batched form fill unavailable ({error}), filling field by field")
+
         # Fill in the form
         try:
             self._fill_form(year, course)
@@ -201,31 +425,34 @@ class USMSScraper:
                 continue
         return None
 
+    def _locate(self, field_name: str, locators: tuple[tuple[str, str], ...]):
+        """Yield (locator, element) for each candidate present, cached locator first."""
+        cached = self._selector_cache.get(field_name)
+        if cached:
+            locators = (cached, *(loc for loc in locators if loc != cached))
+        for locator in locators:
+            try:
+                yield locator, self.driver.find_element(*locator)
+            except NoSuchElementException:
+                continue
+
     def _fill_form(self, year: int, course: str) -> None:
         """Fill in the toptenlocal.php form fields."""
-        # Try to find and fill the Year field — prefer <select> dropdown
+        # Try to find and fill the Year field — <select> by name, or a text input
         year_filled = False
 
-        for name in ["Year", "year", "YearID", "yearID"]:
+        for locator, element in self._locate("year", self._YEAR_LOCATORS):
             try:
-                select = Select(self.driver.find_element(By.NAME, name))
-                select.select_by_visible_text(str(year))
-                year_filled = True
-                break
-            except (NoSuchElementException, Exception):
+                if locator[0] == By.NAME:
+                    Select(element).select_by_visible_text(str(year))
+                else:
+                    element.clear()
+                    element.send_keys(str(year))
+            except Exception:
                 continue
-
-        # Fall back to text input
-        if not year_filled:
-            for selector in ["input[name='Year']", "input[name='year']", "input[type='text']"]:
-                try:
-                    year_input = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    year_input.clear()
-                    year_input.send_keys(str(year))
-                    year_filled = True
-                    break
-                except NoSuchElementException:
-                    continue
+            self._selector_cache["year"] = locator
+            year_filled = True
+            break
 
         if not year_filled:
             # Try finding by label text
@@ -251,18 +478,24 @@ class USMSScraper:
         course_selected = False
 
         # Try select dropdown
-        for name in ["CourseID", "Course", "course", "courseID"]:
+        for locator, element in self._locate("course", self._COURSE_LOCATORS):
             try:
-                select = Select(self.driver.find_element(By.NAME, name))
-                for option in select.options:
-                    if course_label.lower() in option.text.lower() or course in option.text:
-                        select.select_by_visible_text(option.text)
-                        course_selected = True
-                        break
-                if course_selected:
-                    break
-            except (NoSuchElementException, Exception):
+                select = Select(element)
+                # Known option value first; scan the option text if the form has changed
+                try:
+                    select.select_by_value(COURSE_ID_VALUES[course])
+                    course_selected = True
+                except NoSuchElementException:
+                    for option in select.options:
+                        if course_label.lower() in option.text.lower() or course in option.text:
+                            select.select_by_visible_text(option.text)
+                            course_selected = True
+                            break
+            except Exception:
                 continue
+            if course_selected:
+                self._selector_cache["course"] = locator
+                break
 
         # Try radio buttons
         if not course_selected:
@@ -279,39 +512,35 @@ class USMSScraper:
 
         # Select LMSC (South Carolina)
         lmsc_selected = False
-        for name in ["LMSCID", "lmscID", "LMSC", "lmsc"]:
+        for locator, element in self._locate("lmsc", self._LMSC_LOCATORS):
             try:
-                select = Select(self.driver.find_element(By.NAME, name))
+                select = Select(element)
                 # Try by value first
                 try:
                     select.select_by_value(self.config.lmsc_id)
                     lmsc_selected = True
-                    break
                 except NoSuchElementException:
-                    pass
-                # Try by text containing "South Carolina"
-                for option in select.options:
-                    if "south carolina" in option.text.lower():
-                        select.select_by_visible_text(option.text)
-                        lmsc_selected = True
-                        break
-                if lmsc_selected:
-                    break
-            except (NoSuchElementException, Exception):
+                    # Try by text containing "South Carolina"
+                    for option in select.options:
+                        if "south carolina" in option.text.lower():
+                            select.select_by_visible_text(option.text)
+                            lmsc_selected = True
+                            break
+            except Exception:
                 continue
+            if lmsc_selected:
+                self._selector_cache["lmsc"] = locator
+                break
 
         if not lmsc_selected:
             logger.warning("Could not select LMSC — results may not be filtered properly")
 
         # Fill Club abbreviation
-        for name in ["Club", "club", "ClubAbbr", "clubabbr"]:
-            try:
-                club_input = self.driver.find_element(By.NAME, name)
-                club_input.clear()
-                club_input.send_keys(self.config.team_code)
-                return
-            except NoSuchElementException:
-                continue
+        for locator, club_input in self._locate("club", self._CLUB_LOCATORS):
+            club_input.clear()
+            club_input.send_keys(self.config.team_code)
+            self._selector_cache["club"] = locator
+            return
 
         # Try finding text inputs near "club" label
         inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='text']")
@@ -328,22 +557,12 @@ class USMSScraper:
     def _submit_form(self) -> None:
         """Submit the form and wait for results."""
         # Try submit button
-        for selector in [
-            "input[type='submit']",
-            "button[type='submit']",
-            "input[value='Submit']",
-            "input[value='Go']",
-            "input[value='Search']",
-            "button",
-        ]:
-            try:
-                btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                btn.click()
-                # Wait for page to change or results to appear
-                time.sleep(3)
-                return
-            except NoSuchElementException:
-                continue
+        for locator, btn in self._locate("submit", self._SUBMIT_LOCATORS):
+            btn.click()
+            self._selector_cache["submit"] = locator
+            # Wait for page to change or results to appear
+            time.sleep(3)
+            return
 
         # Try submitting the form directly via JS
         try:
@@ -357,40 +576,96 @@ class USMSScraper:
 
         raise RuntimeError("Could not find submit button or form to submit")
 
-    # Regex for event header lines like "Men 45-49 50 Y Freestyle"
-    _EVENT_HEADER_RE = re.compile(r"^(Men|Women)\s+(\d+-\d+)\s+(.+?)\s*$")
-
-    # Regex for data lines like "  1      26.85 Joshua McDuffie, M48, COLM, 554U-YZFEE,"
-    # Time can be: 26.85, 1:01.20, 10:01.20, 1:02:45.67
-    _DATA_LINE_RE = re.compile(
-        r"^\s*(\d+)\s+"  # rank
-        r"([\d:]+\.\d+)\s+"  # time
-        r"(.+?),\s*"  # swimmer name
-        r"([MF]\d+),\s*"  # gender+age (e.g. M48)
-        r"(\w+),\s*"  # club code
-        r"([\w-]+),\s*"  # USMS ID
+    # Field patterns for data lines like "  1      26.85 Joshua McDuffie, M48, COLM, 554U-YZFEE,"
+    # Each is matched against a single comma-separated field, so none can backtrack across
+    # the line. Time can be: 26.85, 1:01.20, 10:01.20, 1:02:45.67
+    _TIME_RE = re.compile(r"[\d:]+\.\d+")
+    _GENDER_AGE_RE = re.compile(r"[MF]\d+")  # e.g. M48
+    _CLUB_RE = re.compile(r"\w+")
+    _USMS_ID_RE = re.compile(r"[\w-]+")
+
+    # The results <pre> block, sliced straight out of the page HTML
+    _PRE_BLOCK_RE = re.compile(r"<pre[^>]*>(.*?)</pre>", re.DOTALL | re.IGNORECASE)
+
+    # Event header inside the results <pre>: <strong><u>Men 45-49 50 Y Freestyle </u></strong>
+    # Tag names match in any case (the raw page isn't normalized by a parser); the text doesn't
+    _HEADER_HTML_RE = re.compile(
+        r"(?i:<strong><u>)(Men|Women)\s+(\d+-\d+)\s+(.+?)\s*(?i:</u></strong>)"
     )
 
-    def _parse_results(self, course: str, year: int) -> list[dict]:
-        """Parse results from the <pre> block on the results page."""
-        records = []
+    # Any HTML tag, stripped before matching data lines
+    _TAG_STRIP_RE = re.compile(r"<[^>]+>")
+
+    # Link text of <a> tags on a data line (the last one is the meet name); any tag case, and
+    # the href may be double-, single- or unquoted
+    _MEET_LINK_RE = re.compile(
+        r"""<a\s+href=(?:"[^"]*"|'[^']*'|[^\s"'>]*)>([^<]+)</a>""", re.IGNORECASE
+    )
+
+    @classmethod
+    def _parse_data_line(cls, line: str) -> tuple[str, str, str] | None:
+        """Split a tag-stripped data line into (rank, time, swimmer), or None if it isn't one.
+
+        Layout: "<rank> <time> <swimmer>, <M|F><age>, <club>, <USMS id>, ...". The swimmer
+        name may itself contain commas ("Smith, Jr."), so the gender/age field is located by
+        scanning forward for the first run of fields that fits the rest of the layout.
+        """
+        parts = line.split(",")
+        if len(parts) < 5:
+            return None
+
+        head = parts[0].split(None, 2)
+        if len(head) < 3:
+            return None
+        rank, swim_time, name_start = head
+        if not rank.isdecimal() or not cls._TIME_RE.fullmatch(swim_time):
+            return None
+
+        # Gender/age, club and USMS ID must be followed by another comma
+        for i in range(1, len(parts) - 3):
+            if (
+                cls._GENDER_AGE_RE.fullmatch(parts[i].lstrip())
+                and cls._CLUB_RE.fullmatch(parts[i + 1].lstrip())
+                and cls._USMS_ID_RE.fullmatch(parts[i + 2].lstrip())
+            ):
+                swimmer = ",".join([name_start, *parts[1:i]]).strip()
+                return rank, swim_time, swimmer
+        return None
 
+    def _parse_results(self, course: str, year: int) -> list[RawRecord]:
+        """Parse results from the <pre> block on the browser's results page."""
         time.sleep(2)
 
         html = self.driver.page_source
-        soup = BeautifulSoup(html, "lxml")
 
         if self.config.save_debug_html:
-            self._dump_page_source(f"results_{course}_{year}")
+            self._dump_page_source(f"results_{course}_{year}", html)
+
+        return self._parse_html(html, course, year)
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        """Decode character references in raw page text, keeping &, < and > escaped.
+
+        Matches what earlier scrapes stored, when text went through an HTML parser and
+        back (e.g. "Shut Up &amp; Swim"), so re-scraped records diff cleanly.
+        """
+        if "&" not in text:
+            return text
+        return escape(unescape(text), quote=False)
+
+    def _parse_html(self, html: str, course: str, year: int) -> list[RawRecord]:
+        """Parse records from the <pre> block of a results page's HTML."""
+        records = []
 
-        pre = soup.find("pre")
-        if not pre:
+        pre_match = self._PRE_BLOCK_RE.search(html)
+        if not pre_match:
             logger.warning("No <pre> block found on results page")
             return records
 
         # Extract meet names from <a> tags before stripping HTML
         # Each data line has: ... <a href="...">View</a> | <a href="...">Meet Name</a>
-        pre_html = str(pre)
+        pre_html = pre_match.group(1)
 
         current_gender = ""
         current_age_group = ""
@@ -403,81 +678,72 @@ class USMSScraper:
                 continue
 
             # Check for event header: <strong><u>Men 45-49 50 Y Freestyle </u></strong>
-            header_match = re.search(
-                r"<strong><u>(Men|Women)\s+(\d+-\d+)\s+(.+?)\s*</u></strong>",
-                line,
-            )
-            if header_match:
-                current_gender = "M" if header_match.group(1) == "Men" else "W"
-                current_age_group = header_match.group(2)
-                current_event = header_match.group(3).strip()
+            if "<strong>" in line.lower():
+                header_match = self._HEADER_HTML_RE.search(line)
+                if header_match:
+                    current_gender = "M" if header_match.group(1) == "Men" else "W"
+                    current_age_group = header_match.group(2)
+                    current_event = self._normalize_text(header_match.group(3).strip())
+                    continue
+
+            # Data lines start with the rank (or a tag, e.g. the opening <pre>); skip the rest
+            # before doing any regex work
+            first = line_stripped[0]
+            if first != "<" and not first.isdigit():
                 continue
 
             # Check for data line — strip HTML first for rank/time/name parsing
-            clean_line = re.sub(r"<[^>]+>", "", line)
-            data_match = self._DATA_LINE_RE.match(clean_line)
-            if not data_match:
+            clean_line = self._TAG_STRIP_RE.sub("", line) if "<" in line else line
+            data = self._parse_data_line(clean_line)
+            if data is None:
                 continue
-
-            rank = data_match.group(1)
-            swim_time = data_match.group(2)
-            swimmer = data_match.group(3).strip()
+            rank, swim_time, swimmer = data
+            swimmer = self._normalize_text(swimmer)
 
             # Extract meet name from the second <a> tag (after "View")
-            meet_links = re.findall(r'<a\s+href="[^"]*">([^<]+)</a>', line)
-            meet = meet_links[-1].strip() if len(meet_links) >= 2 else ""
-
-            record = {
-                "team": self.config.team_code,
-                "event": current_event,
-                "course": course,
-                "gender": current_gender,
-                "age_group": current_age_group,
-                "time": swim_time,
-                "swimmer": swimmer,
-                "date": "",
-                "meet": meet,
-                "year": str(year),
-                "rank": rank,
-            }
+            meet_links = self._MEET_LINK_RE.findall(line)
+            meet = self._normalize_text(meet_links[-1].strip()) if len(meet_links) >= 2 else ""
+
+            record = RawRecord(
+                team=self.config.team_code,
+                event=current_event,
+                course=course,
+                gender=current_gender,
+                age_group=current_age_group,
+                time=swim_time,
+                swimmer=swimmer,
+                date="",
+                meet=meet,
+                year=str(year),
+                rank=rank,
+            )
             records.append(record)
 
         logger.debug(f"Parsed {len(records)} records from {course} {year}")
         return records
 
-    def _save_to_csv(self, records: list[dict], course: str, year: int) -> Path:
+    def _save_to_csv(self, records: list[RawRecord], course: str, year: int) -> Path:
         """Save records to CSV file."""
         filename = f"{self.config.team_code}_{course.lower()}_{year}_records.csv"
         filepath = self.config.output_dir / filename
 
-        fieldnames = [
-            "team",
-            "event",
-            "course",
-            "gender",
-            "age_group",
-            "time",
-            "swimmer",
-            "date",
-            "meet",
-            "year",
-            "rank",
-        ]
-
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(records)
+        get_row = attrgetter(*RAW_RECORD_FIELDS)
+        rows = [get_row(r) for r in records]
+
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(RAW_RECORD_FIELDS)
+            writer.writerows(rows)
 
         return filepath
 
-    def _dump_page_source(self, label: str) -> None:
-        """Save current page HTML for debugging."""
+    def _dump_page_source(self, label: str, html: str | None = None) -> None:
+        """Save page HTML (the browser's current page by default) for debugging."""
         debug_dir = self.config.output_dir / "debug"
         debug_dir.mkdir(parents=True, exist_ok=True)
         path = debug_dir / f"{label}.html"
         with open(path, "w", encoding="utf-8") as f:
-            f.write(self.driver.page_source)
+            f.write(self.driver.page_source if html is None else html)
         logger.debug(f"Saved debug HTML to {path}")
 
 
@@ -490,6 +756,7 @@ def scrape_team_records(
     delay: float = 2.0,
     headless: bool = True,
     save_debug_html: bool = False,
+    use_selenium: bool = True,
 ) -> list[Path]:
     """
     Main entry point for scraping team records.
@@ -503,6 +770,7 @@ def scrape_team_records(
         delay: Seconds to wait between requests
         headless: Run browser in headless mode
         save_debug_html: Save page HTML for debugging
+        use_selenium: Drive a browser; if False, post the form directly over HTTP
 
     Returns:
         List of CSV file paths created
@@ -521,6 +789,7 @@ def scrape_team_records(
         delay_between_requests=delay,
         headless=headless,
         save_debug_html=save_debug_html,
+        use_selenium=use_selenium,
     )
 
     scraper = USMSScraper(config)
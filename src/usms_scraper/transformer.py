@@ -3,8 +3,12 @@
 import csv
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 from .models import (
     TeamRecord,
@@ -13,40 +17,158 @@ from .models import (
     normalize_gender,
 )
 
+try:
+    import orjson
+except ImportError:  # optional, see the "fast" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Raw CSV columns read by transform_record, in the order load_csv yields them
+CSV_COLUMNS = (
+    "team",
+    "event",
+    "course",
+    "gender",
+    "age_group",
+    "time",
+    "swimmer",
+    "date",
+    "meet",
+    "year",
+)
+
+# File buffer for streamed output, and how many NDJSON lines to hand it per write
+_IO_BUFFER_SIZE = 1 << 20
+_NDJSON_BATCH_SIZE = 4096
+
+# Pending CSV input needed before transforming in worker processes pays off; below this,
+# starting the pool (a fresh interpreter per worker under spawn) costs more than it saves
+_PARALLEL_MIN_BYTES = 4 << 20
+
+# Sidecar in the JSON output directory recording which CSVs produced which JSON files
+TRANSFORM_CACHE_NAME = ".transform_cache.json"
+
 
-def load_csv(filepath: Path) -> list[dict]:
-    """Load records from CSV file."""
-    records = []
+def _dumps(obj, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode("utf-8")
+
+
+def _array_delimiters(pretty: bool) -> tuple[bytes, bytes, bytes]:
+    """Opening, item separator and closing bytes of a non-empty array as _dumps lays it out."""
+    if pretty:
+        return b"[\n", b",\n", b"\n]"
+    return b"[", b"," if orjson is not None else b", ", b"]"
+
+
+def _write_concatenated_arrays(output_path: Path, arrays: Iterable[bytes], pretty: bool) -> None:
+    """
+    Write the concatenation of already-encoded JSON arrays as one array.
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    Each input is the _dumps(list, pretty) encoding of a list; its items are copied as-is,
+    so the result matches _dumps of the concatenated lists without re-encoding a record.
+    """
+    opening, separator, closing = _array_delimiters(pretty)
+    empty = True
+
+    with open(output_path, "wb", buffering=_IO_BUFFER_SIZE) as f:
+        for data in arrays:
+            items = data[len(opening) : -len(closing)]
+            if not items:  # "[]"
+                continue
+            f.write(opening if empty else separator)
+            f.write(items)
+            empty = False
+        f.write(b"[]" if empty else closing)
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_transform_cache(cache_path: Path) -> dict:
+    """Load the transform cache, treating a missing or unreadable file as empty."""
+    try:
+        cache = _loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _json_stamp(json_path: Path) -> Optional[dict]:
+    """Cache fields identifying a JSON output file's current contents, or None if missing."""
+    try:
+        st = json_path.stat()
+    except FileNotFoundError:
+        return None
+    return {"json_mtime_ns": st.st_mtime_ns, "json_size": st.st_size}
+
+
+def _row_getter(header: list[str]) -> Callable[[list[str]], tuple[str, ...]]:
+    """Build a function that picks CSV_COLUMNS out of a row, using '' for absent columns."""
+    positions = [header.index(name) if name in header else None for name in CSV_COLUMNS]
+
+    def padded(row: list[str]) -> tuple[str, ...]:
+        return tuple(row[i] if i is not None and i < len(row) else "" for i in positions)
+
+    if None in positions:
+        return padded
+
+    fast = itemgetter(*positions)
+
+    def get_row(row: list[str]) -> tuple[str, ...]:
+        try:
+            return fast(row)
+        except IndexError:  # short row
+            return padded(row)
+
+    return get_row
+
+
+def load_csv(filepath: Path) -> Iterator[tuple[str, ...]]:
+    """Stream records from a CSV file as tuples in CSV_COLUMNS order.
+
+    The file stays open until the generator is exhausted or closed.
+    """
+    count = 0
+
+    with open(filepath, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        get_row = _row_getter(next(reader, []))
         for row in reader:
-            records.append(row)
+            if row:
+                count += 1
+                yield get_row(row)
 
-    logger.info(f"Loaded {len(records)} records from {filepath}")
-    return records
+    logger.info(f"Loaded {count} records from {filepath}")
 
 
-def transform_record(raw: dict) -> Optional[TeamRecord]:
+def transform_record(raw: tuple[str, ...]) -> Optional[TeamRecord]:
     """
-    Transform a raw CSV row into a TeamRecord.
+    Transform a raw CSV row (in CSV_COLUMNS order) into a TeamRecord.
 
     Returns None if the record is invalid.
     """
     try:
+        team, event, course, gender, age_group, time_str, swimmer, date, meet, year = raw
+
         # Extract and normalize fields
-        team = raw.get("team", "").strip().upper()
-        event = raw.get("event", "").strip()
-        course = normalize_course(raw.get("course", ""))
-        gender = normalize_gender(raw.get("gender", ""))
-        age_group = raw.get("age_group", "").strip()
-        time_str = raw.get("time", "").strip()
-        swimmer = raw.get("swimmer", "").strip()
-        date = raw.get("date", "").strip() or None
-        meet = raw.get("meet", "").strip() or None
-        year = raw.get("year", "").strip() or None
+        team = team.strip().upper()
+        event = event.strip()
+        course = normalize_course(course)
+        gender = normalize_gender(gender)
+        age_group = age_group.strip()
+        time_str = time_str.strip()
+        swimmer = swimmer.strip()
+        date = date.strip() or None
+        meet = meet.strip() or None
+        year = year.strip() or None
 
         # Validate required fields
         if not all([team, event, course, gender, age_group, time_str, swimmer]):
@@ -94,26 +216,34 @@ def transform_csv_to_json(
     Returns:
         List of transformed records as dictionaries
     """
-    raw_records = load_csv(csv_path)
+    return _transform_csv(csv_path, output_path, pretty)[0]
+
 
+def _transform_csv(
+    csv_path: Path,
+    output_path: Optional[Path],
+    pretty: bool,
+) -> tuple[list[dict], Optional[bytes]]:
+    """transform_csv_to_json, also returning the JSON bytes written (None if not saved)."""
+    # Rows are transformed as they are read, so the raw rows are never all held at once
     transformed = []
-    for raw in raw_records:
+    total = 0
+    for raw in load_csv(csv_path):
+        total += 1
         record = transform_record(raw)
         if record:
             transformed.append(record.to_dict())
 
-    logger.info(f"Transformed {len(transformed)} of {len(raw_records)} records")
+    logger.info(f"Transformed {len(transformed)} of {total} records")
 
+    data = None
     if output_path:
+        data = _dumps(transformed, pretty)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            if pretty:
-                json.dump(transformed, f, indent=2)
-            else:
-                json.dump(transformed, f)
+        output_path.write_bytes(data)
         logger.info(f"Saved JSON to {output_path}")
 
-    return transformed
+    return transformed, data
 
 
 def transform_multiple_csvs(
@@ -125,6 +255,13 @@ def transform_multiple_csvs(
     """
     Transform multiple CSV files to JSON.
 
+    A CSV whose mtime and size match the previous run (tracked in
+    ``output_dir/.transform_cache.json``) is not re-parsed; its existing JSON output is
+    loaded instead, provided that file is also exactly as that run wrote it. The remaining
+    CSVs are independent and are transformed in parallel worker processes when there is
+    enough input and more than one CPU. The combined output is spliced together from the
+    per-CSV JSON bytes rather than serialized again.
+
     Args:
         csv_paths: List of CSV file paths
         output_dir: Directory for individual JSON outputs
@@ -134,31 +271,71 @@ def transform_multiple_csvs(
     Returns:
         Dictionary mapping filenames to their records
     """
-    all_records = {}
-    combined = []
+    cache_path = output_dir / TRANSFORM_CACHE_NAME
+    cache = _load_transform_cache(cache_path)
+    records_by_path: dict[Path, list[dict]] = {}
+    json_by_path: dict[Path, bytes] = {}
+    pending: list[tuple[Path, Path]] = []
+    pending_bytes = 0
+    pending_entries: dict[Path, tuple[str, dict]] = {}
 
     for csv_path in csv_paths:
         json_filename = csv_path.stem + ".json"
         json_path = output_dir / json_filename
 
-        records = transform_csv_to_json(csv_path, json_path, pretty)
-        all_records[csv_path.name] = records
-        combined.extend(records)
+        st = csv_path.stat()
+        cache_key = str(csv_path.resolve())
+        entry = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "pretty": pretty,
+            "json": json_filename,
+        }
+        # The JSON file must still be the one recorded, not output another run wrote over
+        json_stamp = _json_stamp(json_path)
+        if json_stamp is not None and cache.get(cache_key) == {**entry, **json_stamp}:
+            json_by_path[csv_path] = json_path.read_bytes()
+            records_by_path[csv_path] = _loads(json_by_path[csv_path])
+            logger.info(f"Reused {json_path} ({csv_path.name} unchanged)")
+        else:
+            pending.append((csv_path, json_path))
+            pending_entries[csv_path] = (cache_key, entry)
+            pending_bytes += st.st_size
+
+    pending_csvs = [csv_path for csv_path, _ in pending]
+    pending_jsons = [json_path for _, json_path in pending]
+    workers = min(len(pending), os.cpu_count() or 1)
+    if workers > 1 and pending_bytes >= _PARALLEL_MIN_BYTES:
+        # transform_record is CPU-bound pure Python, so use processes rather than threads
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(_transform_csv, pending_csvs, pending_jsons, repeat(pretty)))
+    else:
+        fresh = [_transform_csv(c, j, pretty) for c, j in pending]
+    for (csv_path, json_path), (records, data) in zip(pending, fresh):
+        records_by_path[csv_path] = records
+        json_by_path[csv_path] = data
+        cache_key, entry = pending_entries[csv_path]
+        cache[cache_key] = {**entry, **_json_stamp(json_path)}
+
+    # Keep the caller's file order for the combined output
+    all_records = {csv_path.name: records_by_path[csv_path] for csv_path in csv_paths}
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(_dumps(cache))
 
     if combined_output:
         combined_output.parent.mkdir(parents=True, exist_ok=True)
-        with open(combined_output, "w", encoding="utf-8") as f:
-            if pretty:
-                json.dump(combined, f, indent=2)
-            else:
-                json.dump(combined, f)
-        logger.info(f"Saved {len(combined)} combined records to {combined_output}")
+        _write_concatenated_arrays(
+            combined_output, (json_by_path[csv_path] for csv_path in csv_paths), pretty
+        )
+        count = sum(len(records_by_path[csv_path]) for csv_path in csv_paths)
+        logger.info(f"Saved {count} combined records to {combined_output}")
 
     return all_records
 
 
 def generate_firebase_import(
-    records: list[dict],
+    records: Iterable[dict],
     output_path: Path,
     collection_name: str = "teamRecords",
 ) -> None:
@@ -174,7 +351,7 @@ def generate_firebase_import(
     }
 
     Args:
-        records: List of record dictionaries
+        records: Record dictionaries (any iterable)
         output_path: Path for output file
         collection_name: Firestore collection name
     """
@@ -187,14 +364,13 @@ def generate_firebase_import(
     firebase_structure = {collection_name: documents}
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(firebase_structure, f, indent=2)
+    output_path.write_bytes(_dumps(firebase_structure))
 
     logger.info(f"Generated Firebase import file with {len(documents)} documents")
 
 
 def generate_ndjson(
-    records: list[dict],
+    records: Iterable[dict],
     output_path: Path,
 ) -> None:
     """
@@ -204,13 +380,21 @@ def generate_ndjson(
     or streaming uploads.
 
     Args:
-        records: List of record dictionaries
+        records: Record dictionaries (any iterable; consumed once)
         output_path: Path for output file
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
+    count = 0
+    batch: list[bytes] = []
+    with open(output_path, "wb", buffering=_IO_BUFFER_SIZE) as f:
         for record in records:
-            f.write(json.dumps(record) + "\n")
-
-    logger.info(f"Generated NDJSON file with {len(records)} records")
+            batch.append(_dumps(record, pretty=False))
+            batch.append(b"\n")
+            count += 1
+            if count % _NDJSON_BATCH_SIZE == 0:
+                f.writelines(batch)
+                batch.clear()
+        f.writelines(batch)
+
+    logger.info(f"Generated NDJSON file with {count} records")